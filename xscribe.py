@@ -4,8 +4,10 @@
 __version__ = "0.3.8"
 
 import argparse
-import glob
+import functools
+import hashlib
 import html
+import itertools
 import json
 import os
 import platform
@@ -16,16 +18,69 @@ import subprocess
 import sys
 import tempfile
 import threading
+import time
 import urllib.parse
-import urllib.request
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 SPINNER_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+YTDLP_PROGRESS_RE = re.compile(r"\[download\]\s+(\d+(?:\.\d+)?)%")
+BROWSER_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
+)
+# Also matches schemes written with entity-encoded ":" and "/" (e.g. "https:&#x2F;&#x2F;"),
+# which the scan unescapes before splitting into URLs
+_PAGE_URL_RE = re.compile(
+    rb"https?(?::|&#0{0,4}58;|&#x0{0,4}3a;|&colon;)(?:/|&#0{0,4}47;|&#x0{0,4}2f;|&sol;){2}[^\s\"'<>\\)]+",
+    re.IGNORECASE,
+)
+# Longest scheme prefix _PAGE_URL_RE can match before the URL body starts
+_PAGE_URL_SCHEME_MAX = len("https&#x00003a;&#x00002f;&#x00002f;")
+_URL_TEXT_RE = re.compile(r"https?://[^\s\"'<>\\)]+", re.IGNORECASE)
+# Cheap superset of what _is_likely_playable_url() can accept
+_MEDIA_HINT_RE = re.compile(
+    rb"\.(?:m3u8|mpd|mp4|webm|m4a|mov|mkv|mp3|wav|flac)|youtube\.com|youtu\.be|vimeo\.com"
+    rb"|wistia|converteai|vturb",
+    re.IGNORECASE,
+)
+_ASSET_EXTENSIONS = (".js", ".css", ".woff", ".woff2", ".png", ".jpg", ".jpeg", ".gif", ".svg")
+_PLAYABLE_EXTENSIONS = (".m3u8", ".mpd", ".mp4", ".webm", ".m4a", ".mov", ".mkv", ".mp3", ".wav", ".flac")
+_YOUTUBE_HOSTS = frozenset({"youtube.com", "www.youtube.com", "m.youtube.com"})
+DIRECT_MEDIA_EXTENSIONS = (
+    ".mp4", ".webm", ".m4a", ".mov", ".mkv", ".mp3", ".wav", ".flac", ".ogg", ".opus",
+)
+DOWNLOAD_EXTENSIONS = (".mp3", ".m4a", ".webm", ".ogg", ".opus", ".wav", ".mp4", ".mkv")
+MODEL_CHOICES = [
+    "tiny", "base", "small", "medium", "large-v3",
+    "large-v3-turbo", "turbo", "distil-large-v3", "distil-medium.en",
+]
+SAMPLE_RATE = 16000
+METADATA_TTL = 24 * 3600
+DOWNLOAD_TTL = 24 * 3600
+PAGE_SCAN_TTL = 3600
+PAGE_SCAN_CHUNK_SIZE = 64 * 1024
+PAGE_SCAN_MAX_BYTES = 4 * 1024 * 1024
+PAGE_SCAN_MAX_RESULTS = 20
+COMPUTE_TYPES = ["auto", "int8", "int8_float16", "int8_float32", "float16", "bfloat16", "float32"]
 
 # Track active spinner and temp dirs for clean Ctrl+C shutdown
 _active_spinner = None
 _temp_dirs = []
 
+# Set when a run is ending so downloads and transcriptions in worker threads give up early
+_stopping = threading.Event()
+_download_procs = set()
+
+# Dependencies already found or installed in this process
+_verified_deps = set()
+
+# Disk cache for URL metadata and downloads; turned off with --no-cache
+_cache_enabled = True
+
 
 def _cleanup_and_exit(signum=None, frame=None):
     """Clean up resources and exit on Ctrl+C."""
@@ -67,29 +122,47 @@ def _get_system_install_hint(package: str) -> str:
     return f"Install {package} from https://ffmpeg.org"
 
 
+def _confirm(prompt: str) -> bool:
+    """Ask a yes/no question, defaulting to yes.
+
+    Returns False without asking when stdin isn't a terminal (e.g. inputs were piped in with '-').
+    """
+    if sys.stdin is None or sys.stdin.closed or not sys.stdin.isatty():
+        return False
+    try:
+        answer = input(prompt).strip().lower()
+    except EOFError:
+        print()
+        return False
+    return answer in ("", "y", "yes")
+
+
 def check_dependencies(need_ytdlp: bool = False, need_whisper: bool = True):
-    """Check and auto-install missing dependencies."""
-    if not shutil.which("ffmpeg") or not shutil.which("ffprobe"):
-        hint = _get_system_install_hint("ffmpeg")
-        print("ffmpeg is required but not installed.")
-        answer = input(f"Run `{hint}`? [Y/n] ").strip().lower()
-        if answer in ("", "y", "yes"):
-            result = subprocess.run(hint.split())
-            if result.returncode != 0:
-                print("Failed to install ffmpeg. Please install it manually.", file=sys.stderr)
+    """Check and auto-install missing dependencies.
+
+    Each dependency is only checked once per process.
+    """
+    if "ffmpeg" not in _verified_deps:
+        if not shutil.which("ffmpeg"):
+            hint = _get_system_install_hint("ffmpeg")
+            print("ffmpeg is required but not installed.")
+            if _confirm(f"Run `{hint}`? [Y/n] "):
+                result = subprocess.run(hint.split())
+                if result.returncode != 0:
+                    print("Failed to install ffmpeg. Please install it manually.", file=sys.stderr)
+                    sys.exit(1)
+                print("✓ ffmpeg installed")
+            else:
+                print(f"Please install ffmpeg manually: {hint}", file=sys.stderr)
                 sys.exit(1)
-            print("✓ ffmpeg installed")
-        else:
-            print(f"Please install ffmpeg manually: {hint}", file=sys.stderr)
-            sys.exit(1)
+        _verified_deps.add("ffmpeg")
 
-    if need_whisper:
+    if need_whisper and "faster-whisper" not in _verified_deps:
         try:
             import faster_whisper  # noqa: F401
         except ImportError:
             print("faster-whisper is required but not installed.")
-            answer = input("Install it now? [Y/n] ").strip().lower()
-            if answer in ("", "y", "yes"):
+            if _confirm("Install it now? [Y/n] "):
                 if _pip_install("faster-whisper"):
                     print("✓ faster-whisper installed")
                 else:
@@ -98,19 +171,89 @@ def check_dependencies(need_ytdlp: bool = False, need_whisper: bool = True):
             else:
                 print("Run manually: pip install faster-whisper", file=sys.stderr)
                 sys.exit(1)
-
-    if need_ytdlp and not shutil.which("yt-dlp"):
-        print("yt-dlp is required for online URLs (including YouTube) but not installed.")
-        answer = input("Install it now? [Y/n] ").strip().lower()
-        if answer in ("", "y", "yes"):
-            if _pip_install("yt-dlp"):
-                print("✓ yt-dlp installed")
+        _verified_deps.add("faster-whisper")
+
+    if need_ytdlp and "yt-dlp" not in _verified_deps:
+        if not shutil.which("yt-dlp"):
+            print("yt-dlp is required for online URLs (including YouTube) but not installed.")
+            if _confirm("Install it now? [Y/n] "):
+                if _pip_install("yt-dlp"):
+                    print("✓ yt-dlp installed")
+                else:
+                    print("Failed to install. Run manually: pip install yt-dlp", file=sys.stderr)
+                    sys.exit(1)
             else:
-                print("Failed to install. Run manually: pip install yt-dlp", file=sys.stderr)
+                print("Run manually: pip install yt-dlp", file=sys.stderr)
                 sys.exit(1)
+        _verified_deps.add("yt-dlp")
+
+
+# --- Cache ---
+
+def _cache_root() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "xscribe"
+
+
+def _cache_path(namespace: str, key) -> Path:
+    digest = hashlib.sha256(json.dumps(key).encode()).hexdigest()[:32]
+    return _cache_root() / namespace / f"{digest}.json"
+
+
+def cache_get(namespace: str, key, ttl: float):
+    """Return a cached JSON value younger than ttl seconds, or None."""
+    if not _cache_enabled:
+        return None
+    path = _cache_path(namespace, key)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def cache_put(namespace: str, key, value):
+    """Store a JSON value in the cache. Failures are ignored."""
+    if not _cache_enabled:
+        return
+    path = _cache_path(namespace, key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(value, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def _download_cache_dir(key) -> Path:
+    """Directory a URL download is kept in, next to its "downloads" cache entry."""
+    return _cache_path("downloads", key).with_suffix("")
+
+
+def prune_download_cache():
+    """Delete cached downloads older than DOWNLOAD_TTL. Failures are ignored."""
+    now = time.time()
+    try:
+        with os.scandir(_cache_root() / "downloads") as it:
+            expired = [entry for entry in it if now - entry.stat().st_mtime > DOWNLOAD_TTL]
+    except OSError:
+        return
+    for entry in expired:
+        if entry.is_dir():
+            shutil.rmtree(entry.path, ignore_errors=True)
         else:
-            print("Run manually: pip install yt-dlp", file=sys.stderr)
-            sys.exit(1)
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def clear_cache():
+    """Delete everything xscribe has cached on disk."""
+    shutil.rmtree(_cache_root(), ignore_errors=True)
 
 
 # --- Helpers ---
@@ -126,19 +269,40 @@ def download_stream(
     download_mode: str,
     video_index: int | None,
     cookies_from_browser: str | None,
+    quiet: bool = False,
+    concurrent_fragments: int = 1,
 ) -> str:
-    """Download an online URL using yt-dlp and return the output file path."""
+    """Download an online URL using yt-dlp and return the output file path.
+
+    With quiet=True no spinner is drawn, so downloads can run in a worker thread.
+    """
     global _active_spinner
+    # A plain media file needs no extractor: fetch it directly and skip yt-dlp's startup
+    if audio_format == "best" and not cookies_from_browser and _is_direct_media_url(url):
+        file_path = _download_direct(url, output_dir, quiet)
+        if file_path:
+            return file_path
+
     output_path = os.path.join(output_dir, "%(title).180B.%(ext)s")
+    # yt-dlp reports the final path (after merges and audio extraction) here; unlike
+    # --print, --print-to-file leaves the progress lines on stdout
+    filepath_log = os.path.join(output_dir, "filepath.txt")
     cmd = [
         "yt-dlp",
         "-o",
         output_path,
         "--restrict-filenames",
         "--windows-filenames",
+        "--newline",
+        "--print-to-file",
+        "after_move:filepath",
+        filepath_log,
     ]
     if cookies_from_browser:
         cmd.extend(["--cookies-from-browser", cookies_from_browser])
+    if concurrent_fragments > 1:
+        # Only affects segmented (HLS/DASH) formats
+        cmd.extend(["--concurrent-fragments", str(concurrent_fragments)])
     if video_index is None:
         cmd.append("--no-playlist")
     else:
@@ -155,57 +319,284 @@ def download_stream(
             cmd.extend(["-f", "bestaudio/best", "--extract-audio", "--audio-format", audio_format])
     cmd.append(url)
 
-    spinner = ProgressSpinner("Downloading stream...")
-    _active_spinner = spinner
-    spinner.start()
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        spinner.stop("✗ Download failed")
-        _active_spinner = None
-        print(f"yt-dlp error: {result.stderr}", file=sys.stderr)
-        lower_err = result.stderr.lower()
-        if ("youtube.com" in url or "youtu.be" in url) and (
-            "http error 403" in lower_err or "sabr" in lower_err
-        ):
-            update_cmd = "pip install -U yt-dlp"
-            if platform.system() == "Darwin":
-                update_cmd = "brew upgrade yt-dlp (or pip install -U yt-dlp)"
-            print(
-                "Hint: YouTube is blocking this request. Try:\n"
-                f"  1) {update_cmd}\n"
-                "  2) xscribe \"<youtube-url>\" --cookies-from-browser chrome\n"
-                "     (or safari/firefox/edge)",
-                file=sys.stderr,
-            )
+    spinner = None
+    if not quiet:
+        spinner = ProgressSpinner("Downloading stream...", total=100.0)
+        _active_spinner = spinner
+        spinner.start()
+    # Stream stdout to pick up real progress; stderr goes to a file so it can't block the pipe
+    with tempfile.TemporaryFile(mode="w+") as err_file:
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=err_file, text=True, bufsize=1
+        )
+        _download_procs.add(proc)
+        try:
+            if _stopping.is_set():
+                proc.terminate()
+            for line in proc.stdout:
+                match = YTDLP_PROGRESS_RE.match(line)
+                if match and spinner:
+                    spinner.update(float(match.group(1)))
+            returncode = proc.wait()
+        finally:
+            _download_procs.discard(proc)
+        err_file.seek(0)
+        stderr = err_file.read()
+    if _stopping.is_set():
         sys.exit(1)
-    spinner.stop("✓ Download complete")
-    _active_spinner = None
+    if returncode != 0:
+        if spinner:
+            spinner.stop("✗ Download failed")
+            _active_spinner = None
+        _report_ytdlp_error(url, stderr)
+        sys.exit(1)
+    if spinner:
+        spinner.stop("✓ Download complete")
+        _active_spinner = None
 
-    candidates = []
-    for pattern in ("*.mp3", "*.m4a", "*.webm", "*.ogg", "*.opus", "*.wav", "*.mp4", "*.mkv"):
-        candidates.extend(glob.glob(os.path.join(output_dir, pattern)))
+    try:
+        with open(filepath_log, encoding="utf-8") as f:
+            reported = [line.strip() for line in f if line.strip()]
+    except OSError:
+        reported = []
+    if reported and os.path.isfile(reported[-1]):
+        return reported[-1]
+
+    # No reported path (unexpected yt-dlp output): fall back to the newest media file
+    with os.scandir(output_dir) as it:
+        candidates = [
+            entry for entry in it
+            if entry.is_file() and entry.name.lower().endswith(DOWNLOAD_EXTENSIONS)
+        ]
     if candidates:
-        return max(candidates, key=os.path.getmtime)
+        return max(candidates, key=lambda entry: entry.stat().st_mtime).path
 
     print("Error: could not find downloaded file", file=sys.stderr)
     sys.exit(1)
 
 
+def _abort_workers():
+    """Make downloads and transcriptions running in worker threads stop as soon as possible."""
+    _stopping.set()
+    for proc in list(_download_procs):
+        try:
+            proc.terminate()
+        except OSError:
+            pass
+
+
+def _report_ytdlp_error(url: str, stderr: str):
+    print(f"yt-dlp error: {stderr}", file=sys.stderr)
+    lower_err = stderr.lower()
+    if ("youtube.com" in url or "youtu.be" in url) and (
+        "http error 403" in lower_err or "sabr" in lower_err
+    ):
+        update_cmd = "pip install -U yt-dlp"
+        if platform.system() == "Darwin":
+            update_cmd = "brew upgrade yt-dlp (or pip install -U yt-dlp)"
+        print(
+            "Hint: YouTube is blocking this request. Try:\n"
+            f"  1) {update_cmd}\n"
+            "  2) xscribe \"<youtube-url>\" --cookies-from-browser chrome\n"
+            "     (or safari/firefox/edge)",
+            file=sys.stderr,
+        )
+
+
+def _is_direct_media_url(url: str) -> bool:
+    """True for URLs pointing straight at a single media file (not an HLS/DASH playlist)."""
+    path = urllib.parse.urlparse(url).path.lower()
+    return path.endswith(DIRECT_MEDIA_EXTENSIONS)
+
+
+def _download_direct(url: str, output_dir: str, quiet: bool = False) -> str | None:
+    """Download a media file over HTTP. Returns None on failure so yt-dlp can retry."""
+    global _active_spinner
+    # deferred: pulls in http.client/email, unneeded for local files
+    import http.client
+    import urllib.request
+    name = urllib.parse.unquote(urllib.parse.urlparse(url).path.rsplit("/", 1)[-1])
+    name = re.sub(r"[^A-Za-z0-9._-]+", "_", name)[-180:] or "download"
+    file_path = os.path.join(output_dir, name)
+
+    spinner = None
+    try:
+        req = urllib.request.Request(url, headers={"User-Agent": BROWSER_USER_AGENT})
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            # Share pages (Dropbox, GitHub blob, ...) end in .mp4 too but serve HTML;
+            # leave anything that isn't media to yt-dlp's extractors
+            content_type = resp.headers.get_content_type()
+            if (
+                content_type.partition("/")[0] not in ("audio", "video")
+                and content_type != "application/octet-stream"
+            ):
+                return None
+            with open(file_path, "wb") as f:
+                size = int(resp.headers.get("Content-Length") or 0)
+                if not quiet:
+                    spinner = ProgressSpinner("Downloading stream...", total=size or None)
+                    _active_spinner = spinner
+                    spinner.start()
+                done = 0
+                while chunk := resp.read(1 << 20):
+                    if _stopping.is_set():
+                        break
+                    f.write(chunk)
+                    done += len(chunk)
+                    if spinner:
+                        spinner.update(done)
+                # read(n) returns short data instead of raising when the connection drops early
+                if size and done < size and not _stopping.is_set():
+                    raise http.client.IncompleteRead(b"", size - done)
+    except (OSError, ValueError, http.client.HTTPException):
+        # HTTPException covers truncated bodies (IncompleteRead), which aren't OSErrors
+        if spinner:
+            spinner.stop("✗ Direct download failed, retrying with yt-dlp")
+            _active_spinner = None
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        return None
+
+    if _stopping.is_set():
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        sys.exit(1)
+    if spinner:
+        spinner.stop("✓ Download complete")
+        _active_spinner = None
+    return file_path
+
+
+def stream_audio(
+    url: str,
+    output_dir: str,
+    cookies_from_browser: str | None,
+    quiet: bool = False,
+    concurrent_fragments: int = 1,
+) -> tuple["numpy.ndarray", str]:
+    """Pipe a URL through yt-dlp and ffmpeg straight into 16 kHz mono samples.
+
+    Nothing is written to disk except the title, which yt-dlp prints into
+    output_dir. Returns (samples, title) with samples as float32 in [-1, 1],
+    the same layout faster_whisper.decode_audio() produces.
+    """
+    global _active_spinner
+    import numpy as np
+
+    title_path = os.path.join(output_dir, "title.txt")
+    ytdlp_cmd = [
+        "yt-dlp",
+        "-o",
+        "-",
+        "-f",
+        "bestaudio/best",
+        "--no-playlist",
+        "--quiet",
+        "--no-warnings",
+        "--no-simulate",
+        "--print-to-file",
+        "%(title).180B",
+        title_path,
+    ]
+    if cookies_from_browser:
+        ytdlp_cmd.extend(["--cookies-from-browser", cookies_from_browser])
+    if concurrent_fragments > 1:
+        ytdlp_cmd.extend(["--concurrent-fragments", str(concurrent_fragments)])
+    ytdlp_cmd.append(url)
+    ffmpeg_cmd = [
+        "ffmpeg", "-nostdin", "-loglevel", "error",
+        "-i", "pipe:0",
+        "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE),
+        "pipe:1",
+    ]
+
+    spinner = None
+    if not quiet:
+        spinner = ProgressSpinner("Streaming audio...")
+        _active_spinner = spinner
+        spinner.start()
+    # One growing buffer instead of a list of chunks joined at the end (a second full copy)
+    pcm = bytearray()
+    with tempfile.TemporaryFile(mode="w+") as ytdlp_err, \
+            tempfile.TemporaryFile(mode="w+") as ffmpeg_err:
+        ytdlp = subprocess.Popen(ytdlp_cmd, stdout=subprocess.PIPE, stderr=ytdlp_err)
+        ffmpeg = subprocess.Popen(
+            ffmpeg_cmd, stdin=ytdlp.stdout, stdout=subprocess.PIPE, stderr=ffmpeg_err
+        )
+        # Only ffmpeg should hold the read end, so yt-dlp sees SIGPIPE if ffmpeg exits
+        ytdlp.stdout.close()
+        _download_procs.update((ytdlp, ffmpeg))
+        try:
+            if _stopping.is_set():
+                ytdlp.terminate()
+                ffmpeg.terminate()
+            while chunk := ffmpeg.stdout.read(1 << 20):
+                pcm += chunk
+                if spinner:
+                    spinner.update(len(pcm))
+            ffmpeg_code = ffmpeg.wait()
+            ytdlp_code = ytdlp.wait()
+        finally:
+            _download_procs.difference_update((ytdlp, ffmpeg))
+        ytdlp_err.seek(0)
+        ffmpeg_err.seek(0)
+        ytdlp_stderr = ytdlp_err.read()
+        ffmpeg_stderr = ffmpeg_err.read()
+
+    if _stopping.is_set():
+        sys.exit(1)
+    if ytdlp_code != 0 or ffmpeg_code != 0 or not pcm:
+        if spinner:
+            spinner.stop("✗ Streaming failed")
+            _active_spinner = None
+        if ytdlp_code != 0:
+            _report_ytdlp_error(url, ytdlp_stderr)
+        else:
+            print(f"ffmpeg error: {ffmpeg_stderr or 'no audio decoded'}", file=sys.stderr)
+        sys.exit(1)
+    if spinner:
+        spinner.stop("✓ Audio streamed")
+        _active_spinner = None
+
+    samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
+    del pcm
+    samples /= 32768.0
+    try:
+        with open(title_path, encoding="utf-8") as f:
+            title = f.readline().strip()
+    except OSError:
+        title = ""
+    title = re.sub(r"[^A-Za-z0-9._-]+", "_", title).strip("_") or "stream"
+    return samples, title
+
+
 def list_url_videos(url: str, cookies_from_browser: str | None) -> list[dict]:
     """List extractable media entries for a URL using yt-dlp metadata."""
+    cache_key = [url, cookies_from_browser]
+    base = cache_get("metadata", cache_key, METADATA_TTL)
+    if base is None:
+        base = _ytdlp_entries(url, cookies_from_browser)
+        if base is None:
+            return []
+        cache_put("metadata", cache_key, base)
+    return _merge_page_media_urls(url, base)
+
+
+def _ytdlp_entries(url: str, cookies_from_browser: str | None) -> list[dict] | None:
+    """Run yt-dlp's metadata extraction for a URL. Returns None on failure."""
     cmd = ["yt-dlp", "--flat-playlist", "--dump-single-json", url]
     if cookies_from_browser:
         cmd[1:1] = ["--cookies-from-browser", cookies_from_browser]
     result = subprocess.run(cmd, capture_output=True, text=True)
     if result.returncode != 0:
         print(f"yt-dlp error: {result.stderr}", file=sys.stderr)
-        return []
+        return None
 
     try:
         data = json.loads(result.stdout)
     except json.JSONDecodeError:
         print("Could not parse yt-dlp metadata output.", file=sys.stderr)
-        return []
+        return None
 
     entries = data.get("entries")
     if entries and isinstance(entries, list):
@@ -215,13 +606,12 @@ def list_url_videos(url: str, cookies_from_browser: str | None) -> list[dict]:
             video_id = entry.get("id") or ""
             entry_url = entry.get("webpage_url") or entry.get("url") or ""
             out.append({"index": i, "title": title, "id": video_id, "url": entry_url, "source": "yt-dlp"})
-        return _merge_page_media_urls(url, out)
+        return out
 
     title = data.get("title") or "(untitled)"
     video_id = data.get("id") or ""
     entry_url = data.get("webpage_url") or data.get("url") or url
-    base = [{"index": 1, "title": title, "id": video_id, "url": entry_url, "source": "yt-dlp"}]
-    return _merge_page_media_urls(url, base)
+    return [{"index": 1, "title": title, "id": video_id, "url": entry_url, "source": "yt-dlp"}]
 
 
 def _merge_page_media_urls(page_url: str, base_entries: list[dict]) -> list[dict]:
@@ -257,41 +647,78 @@ def _merge_page_media_urls(page_url: str, base_entries: list[dict]) -> list[dict
 
 def _scan_page_for_media_urls(page_url: str) -> list[str]:
     """Best-effort page scan for embedded media URLs (e.g., VTurb/ConverteAI/Wistia/m3u8)."""
+    cached = cache_get("page-scan", page_url, PAGE_SCAN_TTL)
+    if cached is not None:
+        return cached
+
+    import urllib.request
+
     try:
         req = urllib.request.Request(
             page_url,
-            headers={
-                "User-Agent": (
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
-                )
-            },
+            headers={"User-Agent": BROWSER_USER_AGENT},
         )
+        cleaned = []
+        seen = set()
         with urllib.request.urlopen(req, timeout=15) as resp:
-            raw = resp.read().decode("utf-8", errors="ignore")
+            for candidate in _iter_page_url_candidates(resp):
+                # Most hits are scripts, styles and images; drop them before decoding/parsing
+                if not _MEDIA_HINT_RE.search(candidate):
+                    continue
+                url = candidate.decode("utf-8", errors="ignore")
+                if "&" in url:
+                    # Entity-encoded markup (e.g. &quot;-quoted JSON player configs) can pack
+                    # several URLs into one raw match; unescape and split them back out
+                    urls = _URL_TEXT_RE.findall(html.unescape(url))
+                else:
+                    urls = [url]
+                for url in urls:
+                    # normalize minor trailing punctuation artifacts from HTML/text extraction
+                    normalized = url.rstrip(".,;")
+                    if not _is_likely_playable_url(normalized):
+                        continue
+                    key = _canonical_media_key(normalized)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    cleaned.append(normalized)
+                if len(cleaned) >= PAGE_SCAN_MAX_RESULTS:
+                    del cleaned[PAGE_SCAN_MAX_RESULTS:]
+                    break
     except Exception:
         return []
 
-    text = html.unescape(raw)
-    pattern = r"https?://[^\s\"'<>\\)]+"
-    found = re.findall(pattern, text, flags=re.IGNORECASE)
-
-    cleaned = []
-    seen = set()
-    for url in found:
-        # normalize minor trailing punctuation artifacts from HTML/text extraction
-        normalized = url.rstrip(".,;")
-        if not _is_likely_playable_url(normalized):
-            continue
-        key = _canonical_media_key(normalized)
-        if key in seen:
-            continue
-        seen.add(key)
-        cleaned.append(normalized)
+    cache_put("page-scan", page_url, cleaned)
     return cleaned
 
 
+def _iter_page_url_candidates(resp) -> Iterator[bytes]:
+    """Yield raw URL matches from a response, reading it in chunks up to PAGE_SCAN_MAX_BYTES."""
+    buf = b""
+    total = 0
+    done = False
+    while not done:
+        chunk = resp.read(PAGE_SCAN_CHUNK_SIZE)
+        total += len(chunk)
+        done = not chunk or total >= PAGE_SCAN_MAX_BYTES
+        buf += chunk
+        # Keep enough of the tail to complete a scheme split across chunks ("htt" + "ps://")
+        keep_from = max(0, len(buf) - _PAGE_URL_SCHEME_MAX)
+        for match in _PAGE_URL_RE.finditer(buf):
+            if not done and match.end() == len(buf):
+                # URL may continue in the next chunk
+                keep_from = match.start()
+                break
+            yield match.group(0)
+            keep_from = max(keep_from, match.end())
+        buf = buf[keep_from:]
+
+
 def _is_likely_playable_url(url: str) -> bool:
+    # Page assets are the bulk of candidates; reject them before paying for urlparse()
+    if url.lower().partition("#")[0].partition("?")[0].endswith(_ASSET_EXTENSIONS):
+        return False
+
     parsed = urllib.parse.urlparse(url)
     host = (parsed.netloc or "").lower()
     path = (parsed.path or "").lower()
@@ -300,13 +727,14 @@ def _is_likely_playable_url(url: str) -> bool:
     if not host or not path:
         return False
 
-    if path.endswith((".js", ".css", ".woff", ".woff2", ".png", ".jpg", ".jpeg", ".gif", ".svg")):
+    # parsed.path has ;params stripped, which the string pre-check above doesn't do
+    if path.endswith(_ASSET_EXTENSIONS):
         return False
 
-    if path.endswith((".m3u8", ".mpd", ".mp4", ".webm", ".m4a", ".mov", ".mkv", ".mp3", ".wav", ".flac")):
+    if path.endswith(_PLAYABLE_EXTENSIONS):
         return True
 
-    if host in ("youtube.com", "www.youtube.com", "m.youtube.com"):
+    if host in _YOUTUBE_HOSTS:
         return path.startswith("/watch") or path.startswith("/embed/")
     if host == "youtu.be":
         return len(path.strip("/")) > 0
@@ -323,26 +751,32 @@ def _is_likely_playable_url(url: str) -> bool:
     return False
 
 
+# Page scans and entry merging look up the same URLs repeatedly
+@functools.lru_cache(maxsize=4096)
 def _canonical_media_key(url: str) -> str:
-    ytid = _youtube_video_id(url)
+    parsed = urllib.parse.urlparse(url)
+    ytid = _parsed_youtube_video_id(parsed)
     if ytid:
         return f"youtube:{ytid}"
 
-    parsed = urllib.parse.urlparse(url)
     host = (parsed.netloc or "").lower()
     path = (parsed.path or "").rstrip("/")
     return f"{host}{path}"
 
 
+@functools.lru_cache(maxsize=4096)
 def _youtube_video_id(url: str) -> str | None:
-    parsed = urllib.parse.urlparse(url)
+    return _parsed_youtube_video_id(urllib.parse.urlparse(url))
+
+
+def _parsed_youtube_video_id(parsed: urllib.parse.ParseResult) -> str | None:
     host = (parsed.netloc or "").lower()
     path = (parsed.path or "").strip("/")
 
     if host == "youtu.be" and path:
         return path.split("/")[0]
 
-    if host in ("youtube.com", "www.youtube.com", "m.youtube.com"):
+    if host in _YOUTUBE_HOSTS:
         if path.startswith("watch"):
             query = urllib.parse.parse_qs(parsed.query)
             values = query.get("v")
@@ -385,199 +819,587 @@ def resolve_video_url(source_url: str, video_index: int | None, cookies_from_bro
     return chosen
 
 
-def get_audio_duration(file_path: str) -> float | None:
-    """Get duration of a media file in seconds using ffprobe."""
-    try:
-        result = subprocess.run(
-            ["ffprobe", "-v", "quiet", "-show_entries", "format=duration",
-             "-of", "default=noprint_wrappers=1:nokey=1", file_path],
-            capture_output=True, text=True,
-        )
-        return float(result.stdout.strip())
-    except (ValueError, FileNotFoundError):
-        return None
+class ProgressSpinner:
+    """Spinner with percentage progress on a single line.
 
+    There is no background redraw: the line is drawn on start() and then
+    redrawn from update() calls, at most every REDRAW_INTERVAL seconds.
+    A quiet spinner tracks progress but draws nothing.
+    """
 
-class ProgressSpinner:
-    """Spinner with percentage progress on a single line."""
+    REDRAW_INTERVAL = 0.25
 
-    def __init__(self, label: str, total: float | None = None):
+    def __init__(self, label: str, total: float | None = None, quiet: bool = False):
         self.label = label
         self.total = total
+        self.quiet = quiet
         self.current = 0.0
-        self._stop = threading.Event()
         self._frame = 0
-        self._thread = threading.Thread(target=self._spin, daemon=True)
+        self._last_draw = 0.0
 
     def start(self):
-        self._thread.start()
+        self._draw()
 
     def update(self, value: float):
         self.current = value
-
-    def _spin(self):
-        while not self._stop.is_set():
-            frame = SPINNER_FRAMES[self._frame % len(SPINNER_FRAMES)]
-            if self.total and self.total > 0:
-                pct = min(self.current / self.total * 100, 100)
-                sys.stdout.write(f"\r{frame} {self.label} {pct:.0f}%")
-            else:
-                sys.stdout.write(f"\r{frame} {self.label}")
-            sys.stdout.flush()
-            self._frame += 1
-            self._stop.wait(0.1)
+        if time.monotonic() - self._last_draw >= self.REDRAW_INTERVAL:
+            self._draw()
+
+    def _draw(self):
+        if self.quiet:
+            return
+        frame = SPINNER_FRAMES[self._frame % len(SPINNER_FRAMES)]
+        if self.total and self.total > 0:
+            pct = min(self.current / self.total * 100, 100)
+            sys.stdout.write(f"\r{frame} {self.label} {pct:.0f}%")
+        else:
+            sys.stdout.write(f"\r{frame} {self.label}")
+        sys.stdout.flush()
+        self._frame += 1
+        self._last_draw = time.monotonic()
 
     def stop(self, final_message: str = ""):
-        self._stop.set()
-        self._thread.join()
+        if self.quiet:
+            return
         sys.stdout.write(f"\r\033[K{final_message}\n")
         sys.stdout.flush()
 
 
+def _has_cuda() -> bool:
+    """Return True if CTranslate2 can see a CUDA device."""
+    try:
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count() > 0
+    except (ImportError, RuntimeError):
+        return False
+
+
+def _default_batch_size() -> int:
+    """Pick a batch size for batched inference: larger on CUDA, smaller on CPU."""
+    return 8 if _has_cuda() else 4
+
+
+def _pick_compute_type() -> str:
+    """Pick the narrowest safe precision: int8_float16 on CUDA, int8 on CPU.
+
+    Falls back (to float16 on CUDA, then "auto") when the device's CTranslate2
+    backend has no fast path for it.
+    """
+    device = "cuda" if _has_cuda() else "cpu"
+    preferred = ("int8_float16", "float16") if device == "cuda" else ("int8",)
+    try:
+        import ctranslate2
+        supported = ctranslate2.get_supported_compute_types(device)
+    except (ImportError, RuntimeError):
+        return preferred[0]
+    return next((t for t in preferred if t in supported), "auto")
+
+
+# "MM:SS" for every second within an hour, so formatting is a single lookup
+_MINUTES_SECONDS = tuple(f"{m:02d}:{s:02d}" for m in range(60) for s in range(60))
+
+
 def format_timestamp(seconds: float) -> str:
     """Format seconds into HH:MM:SS."""
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = int(seconds % 60)
+    h, rem = divmod(int(seconds), 3600)
     if h > 0:
-        return f"{h:02d}:{m:02d}:{s:02d}"
-    return f"{m:02d}:{s:02d}"
+        return f"{h:02d}:{_MINUTES_SECONDS[rem]}"
+    return _MINUTES_SECONDS[rem]
 
 
 # --- Core ---
 
-def transcribe(file_path: str, model_size: str, language: str | None = None) -> list[dict]:
-    """Transcribe a file using faster-whisper. Returns list of segments."""
-    global _active_spinner
+@functools.lru_cache(maxsize=2)
+def _get_model(model_size: str, device: str, compute_type: str, num_workers: int = 1):
+    """Construct a WhisperModel, reusing an already-loaded one with the same settings.
+
+    num_workers > 1 creates a CTranslate2 replica pool so that many threads can
+    transcribe with the model at the same time.
+    """
     from faster_whisper import WhisperModel
 
-    duration = get_audio_duration(file_path)
+    return WhisperModel(
+        model_size, device=device, compute_type=compute_type, num_workers=num_workers
+    )
+
+
+def load_model(model_size: str, compute_type: str | None = None, num_workers: int = 1):
+    """Load a faster-whisper model once so it can be reused across inputs."""
+    global _active_spinner
+    if compute_type is None:
+        compute_type = _pick_compute_type()
 
     spinner = ProgressSpinner("Loading model...")
     _active_spinner = spinner
     spinner.start()
-    model = WhisperModel(model_size, device="auto", compute_type="auto")
+    model = _get_model(model_size, "auto", compute_type, num_workers)
     spinner.stop(f"✓ Model loaded: {model_size}")
     _active_spinner = None
+    return model
+
+
+def load_model_in_background(model_size: str, compute_type: str | None = None) -> Future:
+    """Start loading a model on a worker thread, e.g. while a download runs.
+
+    The thread is a daemon so a failed download or Ctrl+C exits right away
+    instead of waiting for the load (possibly a full model download) to finish.
+    """
+    if compute_type is None:
+        compute_type = _pick_compute_type()
+    future = Future()
+
+    def load():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(_get_model(model_size, "auto", compute_type))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=load, name="xscribe-model-load", daemon=True).start()
+    return future
+
+
+def _await_model(model):
+    """Return a loaded model, waiting for it if it is still loading in the background."""
+    global _active_spinner
+    if not isinstance(model, Future):
+        return model
+    if model.done():
+        print("✓ Model loaded")
+        return model.result()
+
+    spinner = ProgressSpinner("Loading model...")
+    _active_spinner = spinner
+    spinner.start()
+    try:
+        loaded = model.result()
+    except BaseException:
+        spinner.stop("✗ Model failed to load")
+        _active_spinner = None
+        raise
+    spinner.stop("✓ Model loaded")
+    _active_spinner = None
+    return loaded
+
 
-    transcribe_opts = {"beam_size": 5}
+class TranscriptionError(Exception):
+    """Raised by iter_segments() after a transcription failure has been reported."""
+
+
+def iter_segments(
+    media: "str | numpy.ndarray",
+    model,
+    language: str | None = None,
+    batch_size: int | None = None,
+    beam_size: int = 1,
+    vad: bool = True,
+    quiet: bool = False,
+) -> Iterator[dict]:
+    """Transcribe a file with a loaded faster-whisper model, yielding segments as they decode.
+
+    media is a file path, or samples already decoded to 16 kHz mono float32.
+    Errors are reported on stderr and then raised as TranscriptionError. With
+    quiet=True no progress is drawn, so several files can transcribe at once.
+    """
+    global _active_spinner
+    from faster_whisper import decode_audio
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:  # faster-whisper < 1.1
+        BatchedInferencePipeline = None
+
+    if batch_size is None:
+        batch_size = _default_batch_size()
+
+    transcribe_opts = {"beam_size": beam_size}
+    if beam_size == 1:
+        # Pure greedy decoding: skip best-of sampling and temperature fallback passes.
+        # Without fallback, conditioning on earlier text can lock into repetition loops.
+        transcribe_opts["best_of"] = 1
+        transcribe_opts["temperature"] = 0.0
+        transcribe_opts["condition_on_previous_text"] = False
     if language:
         transcribe_opts["language"] = language
 
-    spinner = ProgressSpinner("Transcribing...", total=duration)
+    # Silero VAD drops silent stretches before they reach the decoder. Batched
+    # inference also uses its speech boundaries to split chunks decoded in parallel.
+    runner = model
+    if vad:
+        transcribe_opts["vad_filter"] = True
+        if BatchedInferencePipeline is not None and batch_size > 1:
+            runner = BatchedInferencePipeline(model=model)
+            transcribe_opts["batch_size"] = batch_size
+        else:
+            transcribe_opts["vad_parameters"] = {"min_silence_duration_ms": 500}
+
+    spinner = ProgressSpinner("Transcribing...", quiet=quiet)
     _active_spinner = spinner
     spinner.start()
 
     try:
-        segments_gen, info = model.transcribe(file_path, **transcribe_opts)
+        # Decode once to 16 kHz mono samples; the sample count gives the exact duration
+        if isinstance(media, str):
+            audio = decode_audio(media, sampling_rate=SAMPLE_RATE)
+        else:
+            audio = media
+        spinner.total = audio.shape[0] / SAMPLE_RATE
+        segments_gen, info = runner.transcribe(audio, **transcribe_opts)
     except Exception as e:
         spinner.stop("✗ Transcription failed")
         _active_spinner = None
         print(f"Error: could not transcribe file: {e}", file=sys.stderr)
-        return []
+        raise TranscriptionError(str(e)) from e
 
-    segments = []
+    update = spinner.update
     try:
         for segment in segments_gen:
-            segments.append({
-                "start": segment.start,
-                "end": segment.end,
-                "text": segment.text.strip(),
-            })
-            spinner.update(segment.end)
+            if _stopping.is_set():
+                # The run was interrupted; don't finish this file in the background
+                raise SystemExit(130)
+            end = segment.end
+            update(end)
+            yield {"start": segment.start, "end": end, "text": segment.text.strip()}
     except Exception as e:
         spinner.stop("✗ Transcription failed")
         _active_spinner = None
         print(f"Error during transcription: {e}", file=sys.stderr)
-        return []
+        raise TranscriptionError(str(e)) from e
+    except GeneratorExit:
+        # Consumer stopped early (e.g. the output file could not be written)
+        spinner.stop("✗ Transcription stopped")
+        _active_spinner = None
+        raise
 
     lang = language or info.language
+    skipped = 0.0
+    if vad and getattr(info, "duration_after_vad", None) is not None:
+        skipped = info.duration - info.duration_after_vad
+    if skipped >= 1:
+        lang = f"{lang}, skipped {format_timestamp(skipped)} of silence"
     spinner.stop(f"✓ Transcription complete ({lang})")
     _active_spinner = None
 
-    return segments
 
-
-def write_markdown(segments: list[dict], output_path: str, source: str):
-    """Write transcription segments to a markdown file."""
+def write_markdown(segments: Iterable[dict], output_path: str, source: str):
+    """Write transcription segments to a markdown file as they arrive."""
     with open(output_path, "w") as f:
-        f.write("# Transcription\n\n")
-        f.write(f"**Source:** `{source}`\n\n")
-        f.write("---\n\n")
+        f.write(f"# Transcription\n\n**Source:** `{source}`\n\n---\n\n")
 
+        write = f.write
+        flush = f.flush
         for seg in segments:
-            ts = format_timestamp(seg["start"])
-            f.write(f"**[{ts}]** {seg['text']}\n\n")
+            write(f"**[{format_timestamp(seg['start'])}]** {seg['text']}\n\n")
+            # Flush per segment so the transcript can be followed while it decodes
+            flush()
 
     print(f"✓ Saved to: {output_path}")
 
 
+def _remove_temp_dir(temp_dir: str | None):
+    """Delete a download temp dir and stop tracking it."""
+    if temp_dir and os.path.exists(temp_dir):
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    if temp_dir in _temp_dirs:
+        _temp_dirs.remove(temp_dir)
+
+
+@dataclass(frozen=True, slots=True)
+class Options:
+    """Settings shared by every input in a run."""
+
+    output: str | None
+    language: str | None
+    audio_format: str
+    download_mode: str
+    video_index: int | None
+    cookies_from_browser: str | None
+    concurrent_fragments: int
+    batch_size: int | None
+    beam_size: int
+    vad: bool
+    pipe: bool
+
+
+@dataclass(frozen=True, slots=True)
+class Job:
+    """One input to transcribe.
+
+    file_path is the absolute path of a local file; number is the 1-based
+    position among all inputs, including any dropped as missing.
+    """
+
+    source: str
+    is_stream: bool
+    file_path: str | None = None
+    number: int = 1
+
+
+def expand_stdin_inputs(sources: list[str]) -> list[str]:
+    """Replace a '-' input with the non-blank lines read from stdin."""
+    expanded = []
+    for source in sources:
+        if source == "-":
+            expanded.extend(line.strip() for line in sys.stdin if line.strip())
+        else:
+            expanded.append(source)
+    return expanded
+
+
+def dedupe_inputs(sources: list[str]) -> list[str]:
+    """Drop inputs that repeat an earlier one, keeping the first spelling."""
+    unique = []
+    seen = set()
+    for source in sources:
+        if is_stream_url(source):
+            # Spellings of the same YouTube video collapse; other URLs must match exactly
+            ytid = _youtube_video_id(source)
+            key = f"youtube:{ytid}" if ytid else source
+        else:
+            key = os.path.realpath(source)
+        if key in seen:
+            print(f"Skipping duplicate input: {source}")
+            continue
+        seen.add(key)
+        unique.append(source)
+    return unique
+
+
+def build_jobs(sources: list[str]) -> list[Job]:
+    """Classify each input once and drop local files that don't exist."""
+    jobs = []
+    for number, source in enumerate(sources, 1):
+        if is_stream_url(source):
+            jobs.append(Job(source, True, number=number))
+            continue
+        file_path = os.path.abspath(source)
+        if not os.path.isfile(file_path):
+            print(f"Error: file not found: {file_path}", file=sys.stderr)
+            continue
+        jobs.append(Job(source, False, file_path, number))
+    return jobs
+
+
+def prepare_input(
+    job: Job, options: Options, quiet: bool = False
+) -> tuple["str | numpy.ndarray", str, str | None]:
+    """Return the media for a job, downloading URLs into a temp dir.
+
+    Returns (media, name, temp_dir). media is a file path, or decoded samples
+    when options.pipe streams the URL; name is the stem for the output file;
+    temp_dir is None for local files and cached downloads.
+    """
+    if not job.is_stream:
+        return job.file_path, Path(job.source).stem, None
+
+    source_url = resolve_video_url(job.source, options.video_index, options.cookies_from_browser)
+    pipe = options.pipe and options.download_mode == "audio"
+
+    # Downloads are kept across runs (e.g. to retry with another --model) unless --no-cache
+    cache_key = [source_url, options.audio_format, options.download_mode]
+    cache_downloads = _cache_enabled and not pipe
+    if cache_downloads:
+        cached = cache_get("downloads", cache_key, DOWNLOAD_TTL)
+        if cached and os.path.isfile(cached):
+            if not quiet:
+                print("✓ Using cached download")
+            return cached, Path(cached).stem, None
+        temp_dir = str(_download_cache_dir(cache_key))
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        try:
+            os.makedirs(temp_dir)
+        except OSError:
+            cache_downloads = False
+    if not cache_downloads:
+        temp_dir = tempfile.mkdtemp(prefix="xscribe_")
+    # Tracked until the download succeeds so an interrupted one is removed
+    _temp_dirs.append(temp_dir)
+    try:
+        if pipe:
+            samples, title = stream_audio(
+                source_url,
+                temp_dir,
+                options.cookies_from_browser,
+                quiet,
+                options.concurrent_fragments,
+            )
+            return samples, title, temp_dir
+        file_path = download_stream(
+            source_url,
+            temp_dir,
+            options.audio_format,
+            options.download_mode,
+            None,
+            options.cookies_from_browser,
+            quiet,
+            options.concurrent_fragments,
+        )
+    except BaseException:
+        _remove_temp_dir(temp_dir)
+        raise
+
+    if cache_downloads:
+        _temp_dirs.remove(temp_dir)
+        cache_put("downloads", cache_key, file_path)
+        return file_path, Path(file_path).stem, None
+    return file_path, Path(file_path).stem, temp_dir
+
+
 def process_single(
-    source: str,
-    model_size: str,
-    output: str | None,
-    language: str | None,
-    audio_format: str,
-    download_mode: str,
-    video_index: int | None,
-    cookies_from_browser: str | None,
+    job: Job,
+    model,
+    options: Options,
+    prepared: Future | None = None,
+    quiet: bool = False,
 ):
-    """Process a single input file or online URL."""
-    is_stream = is_stream_url(source)
-    check_dependencies(need_ytdlp=is_stream)
+    """Process a single input file or online URL.
+
+    `model` may be a Future from load_model_in_background(). `prepared` is a
+    future for prepare_input() when the download was started ahead of time in
+    a worker pool. quiet=True suppresses progress output for parallel runs.
+    """
+    source = job.source
     temp_dir = None
 
     try:
-        if is_stream:
-            temp_dir = tempfile.mkdtemp(prefix="xscribe_")
-            _temp_dirs.append(temp_dir)
-            source_url = resolve_video_url(source, video_index, cookies_from_browser)
-            file_path = download_stream(
-                source_url, temp_dir, audio_format, download_mode, None, cookies_from_browser
-            )
+        if prepared is not None:
+            media, base_name, temp_dir = prepared.result()
+            print("✓ Download complete")
         else:
-            file_path = os.path.abspath(source)
-            if not os.path.isfile(file_path):
-                print(f"Error: file not found: {file_path}", file=sys.stderr)
-                return False
+            media, base_name, temp_dir = prepare_input(job, options, quiet)
 
-        if output:
-            output_path = os.path.abspath(output)
+        if options.output:
+            output_path = os.path.abspath(options.output)
         else:
-            base_name = Path(file_path).stem if is_stream else Path(source).stem
             output_path = os.path.join(os.getcwd(), f"{base_name}.md")
 
-        segments = transcribe(file_path, model_size, language)
-
-        if not segments:
-            print(f"No speech detected in: {source}", file=sys.stderr)
+        model = _await_model(model)
+        segments = iter_segments(
+            media,
+            model,
+            options.language,
+            options.batch_size,
+            options.beam_size,
+            options.vad,
+            quiet,
+        )
+        try:
+            # Peek at the first segment so no file is created when nothing was said
+            first = next(segments, None)
+            if first is None:
+                print(f"No speech detected in: {source}", file=sys.stderr)
+                return False
+            try:
+                write_markdown(itertools.chain([first], segments), output_path, source)
+            except TranscriptionError:
+                print(f"Partial transcript left in: {output_path}", file=sys.stderr)
+                return False
+        except TranscriptionError:
             return False
-
-        write_markdown(segments, output_path, source)
+        finally:
+            segments.close()
         return True
 
     finally:
-        if temp_dir and os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir, ignore_errors=True)
-            if temp_dir in _temp_dirs:
-                _temp_dirs.remove(temp_dir)
+        _remove_temp_dir(temp_dir)
 
 
 def cmd_setup(args):
     """Pre-download a Whisper model."""
     check_dependencies()
-    from faster_whisper import WhisperModel
 
     spinner = ProgressSpinner(f"Downloading model: {args.model}...")
     global _active_spinner
     _active_spinner = spinner
     spinner.start()
-    WhisperModel(args.model, device="auto", compute_type="auto")
+    compute_type = args.compute_type or _pick_compute_type()
+    _get_model(args.model, "auto", compute_type)
     spinner.stop(f"✓ Model ready: {args.model}")
     _active_spinner = None
     print("You're all set! Run `xscribe <file>` to transcribe.")
 
 
+def _run_sequential(jobs: list[Job], options: Options, args, total: int) -> int:
+    """Transcribe jobs one at a time in order. Returns the number that succeeded.
+
+    total is the number of inputs given, which the per-item headers count against.
+    """
+    success = 0
+
+    # Downloads are network-bound, so run later ones ahead in a pool while the
+    # single loaded model transcribes inputs one at a time in order. The first
+    # input is left to the foreground so its download shows progress. Only
+    # `lookahead` later inputs are downloading or waiting at any time, so a long
+    # URL list doesn't all land on disk (or, with --pipe, in memory) up front.
+    pool = None
+    prepared = {}
+    ahead = deque(i for i, job in enumerate(jobs) if job.is_stream and i > 0)
+    # A piped result is a whole decoded track held in memory, so keep just one in reserve
+    lookahead = 1 if options.pipe else args.jobs
+    if args.jobs > 1 and ahead:
+        pool = ThreadPoolExecutor(max_workers=min(lookahead, len(ahead)))
+
+    def top_up():
+        while pool and ahead and len(prepared) < lookahead:
+            i = ahead.popleft()
+            prepared[i] = pool.submit(prepare_input, jobs[i], options, True)
+
+    top_up()
+
+    interrupted = False
+    try:
+        if jobs[0].is_stream:
+            # The first download runs in the foreground; load the model alongside it
+            model = load_model_in_background(args.model, args.compute_type)
+        else:
+            model = load_model(args.model, args.compute_type)
+
+        for i, job in enumerate(jobs):
+            if total > 1:
+                print(f"\n[{job.number}/{total}] {job.source}")
+            # Release the result once used and start the next download in its place
+            future = prepared.pop(i, None)
+            top_up()
+            if process_single(job, model, options, future):
+                success += 1
+            if isinstance(model, Future) and model.done():
+                model = model.result()
+    except (KeyboardInterrupt, SystemExit):
+        interrupted = True
+        raise
+    finally:
+        if pool:
+            if interrupted:
+                # The run is over; don't sit out downloads whose files would be thrown away
+                _abort_workers()
+            pool.shutdown(wait=not interrupted, cancel_futures=True)
+            for future in prepared.values():
+                if future.done() and not future.cancelled() and future.exception() is None:
+                    _remove_temp_dir(future.result()[2])
+
+    return success
+
+
+def _run_parallel(jobs: list[Job], options: Options, args, workers: int) -> int:
+    """Transcribe jobs concurrently on a model replica pool. Returns the number that succeeded."""
+    model = load_model(args.model, args.compute_type, num_workers=workers)
+    print(f"Transcribing {len(jobs)} inputs with {workers} workers...")
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    interrupted = False
+    try:
+        futures = [
+            pool.submit(process_single, job, model, options, None, True) for job in jobs
+        ]
+        return sum(1 for future in futures if future.result())
+    except (KeyboardInterrupt, SystemExit):
+        interrupted = True
+        _abort_workers()
+        raise
+    finally:
+        pool.shutdown(wait=not interrupted, cancel_futures=True)
+
+
 def main():
     if len(sys.argv) > 1 and sys.argv[1] == "setup":
         setup_parser = argparse.ArgumentParser(
@@ -588,9 +1410,14 @@ def main():
             "-m",
             "--model",
             default="base",
-            choices=["tiny", "base", "small", "medium", "large-v3"],
+            choices=MODEL_CHOICES,
             help="Model to download (default: base)",
         )
+        setup_parser.add_argument(
+            "--compute-type",
+            choices=COMPUTE_TYPES,
+            help="Precision to load the model with (default: int8_float16 on GPU, int8 on CPU)",
+        )
         args = setup_parser.parse_args(sys.argv[2:])
         cmd_setup(args)
         return
@@ -603,13 +1430,42 @@ def main():
     parser.add_argument("-v", "--version", action="version", version=f"xscribe {__version__}")
 
     # default transcription arguments (on main parser)
-    parser.add_argument("input", nargs="*", help="File path(s) or URL(s) to transcribe")
+    parser.add_argument("input", nargs="*",
+                        help="File path(s) or URL(s) to transcribe; '-' reads more, one per line, "
+                             "from stdin")
     parser.add_argument("-o", "--output", help="Output markdown file path (only for single file)")
     parser.add_argument("-m", "--model", default="base",
-                        choices=["tiny", "base", "small", "medium", "large-v3"],
-                        help="Whisper model size (default: base)")
+                        choices=MODEL_CHOICES,
+                        help="Whisper model size (default: base). turbo and distil-* models "
+                             "are several times faster than large-v3 at similar accuracy.")
     parser.add_argument("-l", "--lang",
                         help="Force language code (e.g. en, es, fr, de, ja). Auto-detected if not set.")
+    parser.add_argument(
+        "--compute-type",
+        choices=COMPUTE_TYPES,
+        help="Model precision (default: int8_float16 on GPU, int8 on CPU). "
+             "Use float32 if quantized output is not accurate enough.",
+    )
+    parser.add_argument(
+        "-b",
+        "--beam-size",
+        type=int,
+        default=1,
+        help="Beam width for decoding (default: 1, greedy). Higher values such as 5 can be "
+             "slightly more accurate on difficult audio but decode several times slower.",
+    )
+    parser.add_argument(
+        "--no-vad",
+        action="store_true",
+        help="Decode silent stretches too instead of skipping them with voice activity "
+             "detection. Also disables batched inference.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        help="Number of audio chunks decoded in parallel (default: 8 on GPU, 4 on CPU). "
+             "Use 1 to disable batched inference.",
+    )
     parser.add_argument(
         "--audio-format",
         default="best",
@@ -622,6 +1478,36 @@ def main():
         choices=["audio", "video"],
         help="For URL inputs, choose audio-first (default) or video-first downloading.",
     )
+    parser.add_argument(
+        "--concurrent-fragments",
+        type=int,
+        default=4,
+        help="For segmented URL streams (HLS/DASH), fragments to download in parallel "
+             "(default: 4).",
+    )
+    parser.add_argument(
+        "--pipe",
+        action="store_true",
+        help="For URL inputs, stream audio from yt-dlp through ffmpeg straight into the "
+             "transcriber instead of saving a temp file (audio download mode only).",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=min(4, os.cpu_count() or 1),
+        help="Number of URL downloads to run ahead in parallel while transcribing "
+             "(default: up to 4). Use 1 to download each URL when its turn comes.",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of inputs to transcribe at the same time using model replicas "
+             "(default: 1). Each replica needs its own memory, so keep this low on GPUs. "
+             "Workers download their own URLs, so --jobs is not used.",
+    )
     parser.add_argument(
         "--list-videos",
         action="store_true",
@@ -636,8 +1522,32 @@ def main():
         "--cookies-from-browser",
         help="For URL inputs, pass browser cookies to yt-dlp (e.g. chrome, safari, firefox, edge).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't read or write the on-disk cache of URL metadata and downloads.",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Delete xscribe's on-disk cache before running (exits if no inputs are given).",
+    )
 
     args = parser.parse_args()
+    if "-" in args.input:
+        args.input = expand_stdin_inputs(args.input)
+
+    global _cache_enabled
+    if args.no_cache:
+        _cache_enabled = False
+    if args.clear_cache:
+        clear_cache()
+        print("✓ Cache cleared")
+        if not args.input:
+            return
+    elif _cache_enabled:
+        # Expire old downloads on every run, not only when another URL is downloaded
+        prune_download_cache()
 
     if not args.input:
         parser.print_help()
@@ -647,6 +1557,22 @@ def main():
         print("Error: --output can only be used with a single input file.", file=sys.stderr)
         sys.exit(1)
 
+    if args.workers < 1:
+        print("Error: --workers must be >= 1.", file=sys.stderr)
+        sys.exit(1)
+    if args.concurrent_fragments < 1:
+        print("Error: --concurrent-fragments must be >= 1.", file=sys.stderr)
+        sys.exit(1)
+    if args.jobs < 1:
+        print("Error: --jobs must be >= 1.", file=sys.stderr)
+        sys.exit(1)
+    if args.beam_size < 1:
+        print("Error: --beam-size must be >= 1.", file=sys.stderr)
+        sys.exit(1)
+    if args.batch_size is not None and args.batch_size < 1:
+        print("Error: --batch-size must be >= 1.", file=sys.stderr)
+        sys.exit(1)
+
     if args.video_index is not None and args.video_index < 1:
         print("Error: --video-index must be >= 1.", file=sys.stderr)
         sys.exit(1)
@@ -657,12 +1583,13 @@ def main():
             sys.exit(1)
 
     if args.list_videos:
+        if any(is_stream_url(source) for source in args.input):
+            check_dependencies(need_ytdlp=True, need_whisper=False)
         listed_any = False
         for source in args.input:
             if not is_stream_url(source):
                 print(f"Skipping non-URL input: {source}")
                 continue
-            check_dependencies(need_ytdlp=True, need_whisper=False)
             entries = list_url_videos(source, args.cookies_from_browser)
             print(f"\n{source}")
             if not entries:
@@ -678,23 +1605,30 @@ def main():
             sys.exit(1)
         return
 
+    sources = dedupe_inputs(args.input)
+    total = len(sources)
+    jobs = build_jobs(sources)
     success = 0
-    total = len(args.input)
-
-    for i, source in enumerate(args.input):
-        if total > 1:
-            print(f"\n[{i + 1}/{total}] {source}")
-        if process_single(
-            source,
-            args.model,
-            args.output,
-            args.lang,
-            args.audio_format,
-            args.download_mode,
-            args.video_index,
-            args.cookies_from_browser,
-        ):
-            success += 1
+    if jobs:
+        check_dependencies(need_ytdlp=any(job.is_stream for job in jobs))
+        options = Options(
+            output=args.output,
+            language=args.lang,
+            audio_format=args.audio_format,
+            download_mode=args.download_mode,
+            video_index=args.video_index,
+            cookies_from_browser=args.cookies_from_browser,
+            concurrent_fragments=args.concurrent_fragments,
+            batch_size=args.batch_size,
+            beam_size=args.beam_size,
+            vad=not args.no_vad,
+            pipe=args.pipe,
+        )
+        workers = min(args.workers, len(jobs))
+        if workers > 1:
+            success = _run_parallel(jobs, options, args, workers)
+        else:
+            success = _run_sequential(jobs, options, args, total)
 
     if total > 1:
         print(f"\nDone: {success}/{total} files transcribed.")